@@ -26,7 +26,6 @@ from typing import Type, Any
 import gi
 from os.path import abspath, join, dirname
 from peewee import SqliteDatabase
-from rx.disposable import CompositeDisposable
 
 from gkraken.conf import APP_PACKAGE_NAME
 
@@ -60,8 +59,6 @@ gettext.textdomain(APP_PACKAGE_NAME)
 
 def _cleanup() -> None:
     _LOG.debug("cleanup")
-    composite_disposable = INJECTOR.get(CompositeDisposable)
-    composite_disposable.dispose()
     database = INJECTOR.get(SqliteDatabase)
     database.close()
     kraken_repository = INJECTOR.get(KrakenRepository)
@@ -33,6 +33,7 @@ from gkraken.model.speed_step import SpeedStep
 from gkraken.model.current_speed_profile import CurrentSpeedProfile
 from gkraken.model.setting import Setting
 from gkraken.presenter.main_presenter import MainPresenter
+from gkraken.presenter.preferences_presenter import PreferencesPresenter
 from gkraken.util.deployment import is_flatpak
 from gkraken.util.desktop_entry import set_autostart_entry
 from gkraken.util.log import LOG_DEBUG_FORMAT
@@ -48,6 +49,7 @@ class Application(Gtk.Application):
                  database: SqliteDatabase,
                  view: MainView,
                  presenter: MainPresenter,
+                 preferences_presenter: PreferencesPresenter,
                  builder: MainBuilder,
                  udev_interactor: UdevInteractor,
                  *args: Any,
@@ -68,6 +70,7 @@ class Application(Gtk.Application):
         self._view = view
         self._presenter = presenter
         self._presenter.application_quit = self.quit
+        self._preferences_presenter = preferences_presenter
         self._window: Optional[Gtk.ApplicationWindow] = None
         self._builder: Gtk.Builder = builder
         self._udev_interactor = udev_interactor
@@ -88,6 +91,12 @@ class Application(Gtk.Application):
     def do_startup(self) -> None:
         Gtk.Application.do_startup(self)
 
+    def do_shutdown(self) -> None:
+        _LOG.debug("Application shutdown")
+        self._preferences_presenter.cleanup()
+        self._presenter.cleanup()
+        Gtk.Application.do_shutdown(self)
+
     def do_command_line(self, command_line: Gio.ApplicationCommandLine) -> int:
         start_app = True
         options = command_line.get_options_dict()
@@ -18,12 +18,12 @@
 import logging
 
 from typing import Optional, NewType
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
 from injector import Module, provider, singleton, Injector
 from liquidctl.driver import find_liquidctl_devices
 from liquidctl.driver.kraken_two import KrakenTwoDriver
 from peewee import SqliteDatabase
-from rx.disposable import CompositeDisposable
+from rx.scheduler.mainloop import GtkScheduler
 from rx.subject import Subject
 
 from gkraken.conf import APP_PACKAGE_NAME, APP_MAIN_UI_NAME, APP_DB_NAME, APP_EDIT_SPEED_PROFILE_UI_NAME, \
@@ -72,9 +72,9 @@ class ProviderModule(Module):
 
     @singleton
     @provider
-    def provide_thread_pool_scheduler(self) -> CompositeDisposable:
-        _LOG.debug("provide CompositeDisposable")
-        return CompositeDisposable()
+    def provide_gtk_scheduler(self) -> GtkScheduler:
+        _LOG.debug("provide GtkScheduler")
+        return GtkScheduler(GLib)
 
     @singleton
     @provider
@@ -35,4 +35,4 @@ class GetStatusInteractor:
 
     def execute(self) -> Observable:
         _LOG.debug("GetStatusInteractor.execute()")
-        return rx.defer(lambda _: rx.just(self._kraken_repository.get_status()))
+        return rx.from_callable(self._kraken_repository.get_status)
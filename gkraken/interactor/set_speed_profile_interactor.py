@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with gsi.  If not, see <http://www.gnu.org/licenses/>.
 import logging
-from typing import List, Tuple
+from array import array
 
 import rx
 from injector import singleton, inject
@@ -34,6 +34,8 @@ class SetSpeedProfileInteractor:
                  ) -> None:
         self._kraken_repository = kraken_repository
 
-    def execute(self, channel_value: str, profile_data: List[Tuple[int, int]]) -> Observable:
+    def execute(self, channel_value: str, temperatures: 'array[int]', duties: 'array[int]') -> Observable:
         _LOG.debug("SetSpeedProfileInteractor.execute()")
-        return rx.defer(lambda _: rx.just(self._kraken_repository.set_speed_profile(channel_value, profile_data)))
+        return rx.defer(lambda _: rx.just(self._kraken_repository.set_speed_profile(channel_value,
+                                                                                    temperatures,
+                                                                                    duties)))
@@ -24,6 +24,7 @@ from playhouse.sqlite_ext import AutoIncrementField
 from gkraken.di import INJECTOR, SpeedProfileChangedSubject
 from gkraken.model.channel_type import ChannelType
 from gkraken.model.db_change import DbChange
+from gkraken.util.view import invalidate_speed_profile_data
 
 _LOG = logging.getLogger(__name__)
 SPEED_PROFILE_CHANGED_SUBJECT = INJECTOR.get(SpeedProfileChangedSubject)
@@ -46,10 +47,12 @@ class SpeedProfile(Model):
 @post_save(sender=SpeedProfile)
 def on_speed_profile_added(_: Any, profile: SpeedProfile, created: bool) -> None:
     _LOG.debug("Profile added")
+    invalidate_speed_profile_data(profile.id)
     SPEED_PROFILE_CHANGED_SUBJECT.on_next(DbChange(profile, DbChange.INSERT if created else DbChange.UPDATE))
 
 
 @post_delete(sender=SpeedProfile)
 def on_speed_profile_deleted(_: Any, profile: SpeedProfile) -> None:
     _LOG.debug("Profile deleted")
+    invalidate_speed_profile_data(profile.id)
     SPEED_PROFILE_CHANGED_SUBJECT.on_next(DbChange(profile, DbChange.DELETE))
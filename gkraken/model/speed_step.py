@@ -23,6 +23,7 @@ from playhouse.signals import Model, post_save, post_delete
 from gkraken.di import INJECTOR, SpeedStepChangedSubject
 from gkraken.model.db_change import DbChange
 from gkraken.model.speed_profile import SpeedProfile
+from gkraken.util.view import invalidate_speed_profile_data
 
 _LOG = logging.getLogger(__name__)
 SPEED_STEP_CHANGED_SUBJECT = INJECTOR.get(SpeedStepChangedSubject)
@@ -42,10 +43,12 @@ class SpeedStep(Model):
 @post_save(sender=SpeedStep)
 def on_speed_step_added(_: Any, step: SpeedStep, created: bool) -> None:
     _LOG.debug("Profile added")
+    invalidate_speed_profile_data(step.profile_id)
     SPEED_STEP_CHANGED_SUBJECT.on_next(DbChange(step, DbChange.INSERT if created else DbChange.UPDATE))
 
 
 @post_delete(sender=SpeedStep)
 def on_speed_step_deleted(_: Any, step: SpeedStep) -> None:
     _LOG.debug("Step deleted")
+    invalidate_speed_profile_data(step.profile_id)
     SPEED_STEP_CHANGED_SUBJECT.on_next(DbChange(step, DbChange.DELETE))
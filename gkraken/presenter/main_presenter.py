@@ -16,15 +16,18 @@
 # along with gkraken.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import bisect
 import logging
 import multiprocessing
-from typing import Optional, Any, List, Tuple, Dict, Callable
+from array import array
+from collections import defaultdict
+from itertools import chain
+from typing import Optional, Any, List, Tuple, Dict, Callable, Iterable
 
 import rx
-from gi.repository import GLib
 from injector import inject, singleton
 from rx import Observable, operators
-from rx.disposable import CompositeDisposable
+from rx.core.typing import Disposable
 from rx.scheduler import ThreadPoolScheduler
 from rx.scheduler.mainloop import GtkScheduler
 
@@ -47,7 +50,12 @@ from gkraken.util.deployment import is_flatpak
 from gkraken.util.view import open_uri, get_default_application
 
 _LOG = logging.getLogger(__name__)
+_FAN_CHANNEL = ChannelType.FAN.value
+_PUMP_CHANNEL = ChannelType.PUMP.value
 _ADD_NEW_PROFILE_INDEX = -10
+_ADD_NEW_PROFILE_ROW = (_ADD_NEW_PROFILE_INDEX, "<span style='italic' alpha='50%'>Add new profile...</span>")
+# the refresh workload is I/O bound (USB, HTTP, SQLite): more workers only add idle threads
+_MAX_SCHEDULER_WORKERS = 4
 
 
 class MainViewInterface:
@@ -57,7 +65,7 @@ class MainViewInterface:
     def refresh_status(self, status: Optional[Status]) -> None:
         raise NotImplementedError()
 
-    def refresh_profile_combobox(self, channel: ChannelType, data: List[Tuple[int, str]],
+    def refresh_profile_combobox(self, channel: ChannelType, data: Iterable[Tuple[int, str]],
                                  active: Optional[int]) -> None:
         raise NotImplementedError()
 
@@ -108,13 +116,14 @@ class MainPresenter:
                  check_new_version_interactor: CheckNewVersionInteractor,
                  speed_profile_changed_subject: SpeedProfileChangedSubject,
                  speed_step_changed_subject: SpeedStepChangedSubject,
-                 composite_disposable: CompositeDisposable,
+                 gtk_scheduler: GtkScheduler,
                  ) -> None:
         _LOG.debug("init MainPresenter ")
         self.main_view: MainViewInterface = MainViewInterface()
         self._edit_speed_profile_presenter = edit_speed_profile_presenter
         self._preferences_presenter = preferences_presenter
-        self._scheduler = ThreadPoolScheduler(multiprocessing.cpu_count())
+        self._scheduler = ThreadPoolScheduler(min(_MAX_SCHEDULER_WORKERS, multiprocessing.cpu_count()))
+        self._gtk_scheduler = gtk_scheduler
         self._has_supported_kraken_interactor = has_supported_kraken_interactor
         self._get_status_interactor: GetStatusInteractor = get_status_interactor
         self._set_speed_profile_interactor: SetSpeedProfileInteractor = set_speed_profile_interactor
@@ -122,9 +131,11 @@ class MainPresenter:
         self._check_new_version_interactor = check_new_version_interactor
         self._speed_profile_changed_subject = speed_profile_changed_subject
         self._speed_step_changed_subject = speed_step_changed_subject
-        self._composite_disposable: CompositeDisposable = composite_disposable
+        self._disposables: List[Disposable] = []
         self._profile_selected: Dict[str, SpeedProfile] = {}
         self._should_update_fan_speed: bool = False
+        self._fan_temps: 'array[int]' = array('B')
+        self._fan_duties: 'array[int]' = array('B')
         self._legacy_firmware_dialog_shown: bool = False
         self.application_quit: Callable = lambda *args: None  # will be set by the Application
 
@@ -135,6 +146,12 @@ class MainPresenter:
         if self._settings_interactor.get_int('settings_check_new_version'):
             self._check_new_version()
 
+    def cleanup(self) -> None:
+        _LOG.debug("MainPresenter cleanup")
+        for disposable in self._disposables:
+            disposable.dispose()
+        self._disposables.clear()
+
     def on_application_window_delete_event(self, *_: Any) -> bool:
         if self._settings_interactor.get_int('settings_minimize_to_tray'):
             self.on_toggle_app_window_clicked()
@@ -161,9 +178,9 @@ class MainPresenter:
             self.main_view.refresh_chart(profile)
 
     def _check_supported_kraken(self) -> None:
-        self._composite_disposable.add(self._has_supported_kraken_interactor.execute().pipe(
+        self._disposables.append(self._has_supported_kraken_interactor.execute().pipe(
             operators.subscribe_on(self._scheduler),
-            operators.observe_on(GtkScheduler(GLib)),
+            operators.observe_on(self._gtk_scheduler),
         ).subscribe(on_next=self._has_supported_kraken_result))
 
     def _has_supported_kraken_result(self, has_supported_kraken: bool) -> None:
@@ -183,11 +200,11 @@ class MainPresenter:
     def _start_refresh(self) -> None:
         _LOG.debug("start refresh")
         refresh_interval = self._settings_interactor.get_int('settings_refresh_interval')
-        self._composite_disposable.add(rx.interval(refresh_interval, scheduler=self._scheduler).pipe(
+        self._disposables.append(rx.interval(refresh_interval, scheduler=self._scheduler).pipe(
             operators.start_with(0),
             operators.subscribe_on(self._scheduler),
             operators.flat_map(lambda _: self._get_status()),
-            operators.observe_on(GtkScheduler(GLib)),
+            operators.observe_on(self._gtk_scheduler),
         ).subscribe(on_next=self._update_status,
                     on_error=self._handle_refresh_error))
 
@@ -213,53 +230,59 @@ class MainPresenter:
 
     def _update_status(self, status: Optional[Status]) -> None:
         if status is not None:
-            if self._should_update_fan_speed:
-                last_applied: CurrentSpeedProfile = CurrentSpeedProfile.get_or_none(channel=ChannelType.FAN.value)
-                if last_applied is not None:
-                    status.fan_duty = self._get_fan_duty(last_applied.profile, status.liquid_temperature)
+            if self._should_update_fan_speed and self._fan_temps:
+                status.fan_duty = self._get_fan_duty(self._fan_temps, self._fan_duties, status.liquid_temperature)
             self.main_view.refresh_status(status)
             if not self._legacy_firmware_dialog_shown and status.firmware_version.startswith('2.'):
                 self._legacy_firmware_dialog_shown = True
                 self.main_view.show_legacy_firmware_dialog()
 
     @staticmethod
-    def _get_fan_duty(profile: SpeedProfile, liquid_temperature: float) -> float:
-        p_1 = ([(i.temperature, i.duty) for i in profile.steps if i.temperature <= liquid_temperature] or [None])[-1]
-        p_2 = next(((i.temperature, i.duty) for i in profile.steps if i.temperature > liquid_temperature), None)
-        duty = 0.0
-        if p_1 and p_2:
-            duty = ((p_2[1] - p_1[1]) / (p_2[0] - p_1[0])) * (liquid_temperature - p_1[0]) + p_1[1]
-        elif p_1:
-            duty = float(p_1[1])
-        elif p_2:
-            duty = float(p_2[1])
-        return duty
+    def _get_fan_duty(temps: 'array[int]', duties: 'array[int]', liquid_temperature: float) -> float:
+        index = bisect.bisect_right(temps, liquid_temperature)
+        if index == 0:
+            return float(duties[0])
+        if index == len(temps):
+            return float(duties[-1])
+        t_1, t_2 = temps[index - 1], temps[index]
+        d_1, d_2 = duties[index - 1], duties[index]
+        return ((d_2 - d_1) / (t_2 - t_1)) * (liquid_temperature - t_1) + d_1
 
     # def _load_last_profile(self) -> None:
     #     for current in CurrentSpeedProfile.select():
 
     @staticmethod
-    def _get_profile_list(channel: ChannelType) -> List[Tuple[int, str]]:
-        return [(p.id, p.name) for p in SpeedProfile.select().where(SpeedProfile.channel == channel.value)]
+    def _get_profile_lists(channel: Optional[ChannelType] = None) -> Dict[str, List[Tuple[int, str]]]:
+        query = SpeedProfile.select(SpeedProfile.id, SpeedProfile.name, SpeedProfile.channel)
+        if channel is not None:
+            query = query.where(SpeedProfile.channel == channel.value)
+        profile_lists: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for profile in query:
+            profile_lists[profile.channel].append((profile.id, profile.name))
+        return profile_lists
 
     def _refresh_speed_profiles(self, init: bool = False, selecter_profile_id: Optional[int] = None) -> None:
-        for channel in ChannelType:
-            self._refresh_speed_profile(channel, init, selecter_profile_id)
-
-    def _refresh_speed_profile(self, channel: ChannelType, init: bool = False,
-                               profile_id: Optional[int] = None) -> None:
-        data = self._get_profile_list(channel)
-        active = None
-        if profile_id is not None:
-            active = next(i for i, item in enumerate(data) if item[0] == profile_id)
-        elif init and self._settings_interactor.get_bool('settings_load_last_profile'):
+        profile_lists = self._get_profile_lists()
+        current_profiles: Dict[str, SpeedProfile] = {}
+        if selecter_profile_id is None and init and self._settings_interactor.get_bool('settings_load_last_profile'):
             self._should_update_fan_speed = True
-            current: CurrentSpeedProfile = CurrentSpeedProfile.get_or_none(channel=channel.value)
+            current_profiles = {current.channel: current.profile for current in
+                                CurrentSpeedProfile.select(CurrentSpeedProfile, SpeedProfile).join(SpeedProfile)}
+        for channel in ChannelType:
+            profile_id = selecter_profile_id
+            current = current_profiles.get(channel.value)
             if current is not None:
-                active = next(i for i, item in enumerate(data) if item[0] == current.profile.id)
-                self._set_speed_profile(current.profile)
-        data.append((_ADD_NEW_PROFILE_INDEX, "<span style='italic' alpha='50%'>Add new profile...</span>"))
-        self.main_view.refresh_profile_combobox(channel, data, active)
+                profile_id = current.id
+                self._set_speed_profile(current)
+            self._show_speed_profile_list(channel, profile_lists[channel.value], profile_id)
+
+    def _refresh_speed_profile(self, channel: ChannelType, profile_id: Optional[int] = None) -> None:
+        self._show_speed_profile_list(channel, self._get_profile_lists(channel)[channel.value], profile_id)
+
+    def _show_speed_profile_list(self, channel: ChannelType, data: List[Tuple[int, str]],
+                                 profile_id: Optional[int]) -> None:
+        active = next((i for i, (item_id, _) in enumerate(data) if item_id == profile_id), None)
+        self.main_view.refresh_profile_combobox(channel, chain(data, (_ADD_NEW_PROFILE_ROW,)), active)
 
     def on_menu_settings_clicked(self, *_: Any) -> None:
         self._preferences_presenter.show()
@@ -309,8 +332,9 @@ class MainPresenter:
             self.main_view.refresh_chart(profile)
 
     @staticmethod
-    def _get_profile_data(profile: SpeedProfile) -> List[Tuple[int, int]]:
-        return [(p.temperature, p.duty) for p in profile.steps]
+    def _get_profile_data(profile: SpeedProfile) -> Tuple['array[int]', 'array[int]']:
+        steps = list(profile.steps.order_by(SpeedStep.temperature))
+        return array('B', [s.temperature for s in steps]), array('B', [s.duty for s in steps])
 
     def on_fan_edit_button_clicked(self, *_: Any) -> None:
         self._on_edit_button_clicked(ChannelType.FAN)
@@ -331,35 +355,39 @@ class MainPresenter:
         speed_step: SpeedStep = profile.steps[0]
         speed_step.duty = value
         speed_step.save()
-        if channel == ChannelType.FAN.value:
+        if channel == _FAN_CHANNEL:
             self._should_update_fan_speed = False
         self.main_view.refresh_chart(profile)
 
     def on_fan_apply_button_clicked(self, *_: Any) -> None:
-        self._set_speed_profile(self._profile_selected[ChannelType.FAN.value])
+        self._set_speed_profile(self._profile_selected[_FAN_CHANNEL])
         self._should_update_fan_speed = True
 
     def on_pump_apply_button_clicked(self, *_: Any) -> None:
-        self._set_speed_profile(self._profile_selected[ChannelType.PUMP.value])
+        self._set_speed_profile(self._profile_selected[_PUMP_CHANNEL])
 
     def _set_speed_profile(self, profile: SpeedProfile) -> None:
-        observable = self._set_speed_profile_interactor \
-            .execute(profile.channel, self._get_profile_data(profile))
-        self._composite_disposable.add(observable.pipe(
+        temperatures, duties = self._get_profile_data(profile)
+        observable = self._set_speed_profile_interactor.execute(profile.channel, temperatures, duties)
+        self._disposables.append(observable.pipe(
             operators.subscribe_on(self._scheduler),
-            operators.observe_on(GtkScheduler(GLib)),
-        ).subscribe(on_next=lambda _: self._update_current_speed_profile(profile),
+            operators.observe_on(self._gtk_scheduler),
+        ).subscribe(on_next=lambda _: self._update_current_speed_profile(profile, temperatures, duties),
                     on_error=lambda e: (_LOG.exception("Set cooling error: %s", str(e)),
                                         self.main_view.set_statusbar_text('Error applying %s speed profile!'
                                                                           % profile.channel))))
 
-    def _update_current_speed_profile(self, profile: SpeedProfile) -> None:
+    def _update_current_speed_profile(self, profile: SpeedProfile,
+                                      temperatures: 'array[int]', duties: 'array[int]') -> None:
         current: CurrentSpeedProfile = CurrentSpeedProfile.get_or_none(channel=profile.channel)
         if current is None:
             CurrentSpeedProfile.create(channel=profile.channel, profile=profile)
         else:
             current.profile = profile
             current.save()
+        if profile.channel == _FAN_CHANNEL:
+            self._fan_temps = temperatures
+            self._fan_duties = duties
         self.main_view.set_statusbar_text('%s cooling profile applied' % profile.channel.capitalize())
 
     def _log_exception_return_empty_observable(self, ex: Exception, _: Observable) -> Observable:
@@ -379,9 +407,9 @@ class MainPresenter:
         return observable
 
     def _check_new_version(self) -> None:
-        self._composite_disposable.add(self._check_new_version_interactor.execute().pipe(
+        self._disposables.append(self._check_new_version_interactor.execute().pipe(
             operators.subscribe_on(self._scheduler),
-            operators.observe_on(GtkScheduler(GLib)),
+            operators.observe_on(self._gtk_scheduler),
         ).subscribe(on_next=self._handle_new_version_response,
                     on_error=lambda e: _LOG.exception("Check new version error: %s", str(e))))
 
@@ -15,11 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with gkraken.  If not, see <http://www.gnu.org/licenses/>.
 import logging
-import re
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from gi.repository import Gtk
 from injector import singleton, inject
+from rx import operators
+from rx.scheduler.mainloop import GtkScheduler
+from rx.subject import Subject
 
 from gkraken.conf import SETTINGS_DEFAULTS
 from gkraken.interactor.settings_interactor import SettingsInteractor
@@ -27,6 +29,13 @@ from gkraken.util.deployment import is_flatpak
 from gkraken.util.desktop_entry import set_autostart_entry, AUTOSTART_FILE_PATH
 
 _LOG = logging.getLogger(__name__)
+_SWITCH_SUFFIX = '_switch'
+_SPINBUTTON_SUFFIX = '_spinbutton'
+_SPINBUTTON_DEBOUNCE_TIME = 0.3  # seconds
+
+
+def _remove_suffix(text: str, suffix: str) -> str:
+    return text[:-len(suffix)] if text.endswith(suffix) else text
 
 
 class PreferencesViewInterface:
@@ -45,34 +54,62 @@ class PreferencesPresenter:
     @inject
     def __init__(self,
                  settings_interactor: SettingsInteractor,
+                 gtk_scheduler: GtkScheduler,
                  ) -> None:
         _LOG.debug("init PreferencesPresenter ")
         self.view: PreferencesViewInterface = PreferencesViewInterface()
         self._settings_interactor = settings_interactor
+        self._settings_getters: Dict[type, Callable[[str], Any]] = {
+            bool: settings_interactor.get_bool,
+            int: settings_interactor.get_int,
+        }
+        self._pending_int_settings: Dict[str, int] = {}
+        self._spinbutton_value_changed_subject = Subject()
+        self._spinbutton_value_changed_disposable = self._spinbutton_value_changed_subject.pipe(
+            operators.group_by(lambda key: key),
+            operators.flat_map(lambda group: group.pipe(
+                operators.debounce(_SPINBUTTON_DEBOUNCE_TIME, scheduler=gtk_scheduler))),
+        ).subscribe(on_next=self._save_int_setting,
+                    on_error=lambda e: _LOG.exception("Save setting error: %s", str(e)))
 
     def show(self) -> None:
         self._init_settings()
         self.view.show()
 
+    def cleanup(self) -> None:
+        _LOG.debug("PreferencesPresenter cleanup")
+        self._flush_pending_int_settings()
+        self._spinbutton_value_changed_disposable.dispose()
+
+    def on_dialog_hide(self, *_: Any) -> None:
+        self._flush_pending_int_settings()
+
     def _init_settings(self) -> None:
-        settings: Dict[str, Any] = {}
-        for key, default_value in SETTINGS_DEFAULTS.items():
-            if isinstance(default_value, bool):
-                if key == 'settings_launch_on_login' and not AUTOSTART_FILE_PATH.is_file():
-                    self._settings_interactor.set_bool(key, False)
-                settings[key] = self._settings_interactor.get_bool(key)
-            elif isinstance(default_value, int):
-                settings[key] = self._settings_interactor.get_int(key)
+        self._flush_pending_int_settings()
+        if not AUTOSTART_FILE_PATH.is_file():
+            self._settings_interactor.set_bool('settings_launch_on_login', False)
+        settings: Dict[str, Any] = {key: self._settings_getters[type(default_value)](key)
+                                    for key, default_value in SETTINGS_DEFAULTS.items()}
         self.view.refresh_settings(settings)
 
     def on_setting_changed(self, widget: Any, *args: Any) -> None:
         if isinstance(widget, Gtk.Switch):
             value = args[0]
-            key = re.sub('_switch$', '', widget.get_name())
+            key = _remove_suffix(widget.get_name(), _SWITCH_SUFFIX)
             self._settings_interactor.set_bool(key, value)
             if key == 'settings_launch_on_login' and not is_flatpak():
                 set_autostart_entry(value)
         elif isinstance(widget, Gtk.SpinButton):
-            key = re.sub('_spinbutton$', '', widget.get_name())
+            key = _remove_suffix(widget.get_name(), _SPINBUTTON_SUFFIX)
             value = widget.get_value_as_int()
+            self._pending_int_settings[key] = value
+            self._spinbutton_value_changed_subject.on_next(key)
+
+    def _save_int_setting(self, key: str) -> None:
+        if key in self._pending_int_settings:
+            self._settings_interactor.set_int(key, self._pending_int_settings.pop(key))
+
+    def _flush_pending_int_settings(self) -> None:
+        for key, value in self._pending_int_settings.items():
             self._settings_interactor.set_int(key, value)
+        self._pending_int_settings.clear()
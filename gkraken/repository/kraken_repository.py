@@ -16,8 +16,9 @@
 # along with gsi.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 import threading
+from array import array
 from enum import Enum
-from typing import Optional, List, Tuple
+from typing import Optional
 
 from injector import singleton, inject
 from liquidctl.driver.kraken_two import KrakenTwoDriver
@@ -65,14 +66,14 @@ class KrakenRepository:
         return None
 
     @synchronized_with_attr("lock")
-    def set_speed_profile(self, channel_value: str, profile_data: List[Tuple[int, int]]) -> None:
+    def set_speed_profile(self, channel_value: str, temperatures: 'array[int]', duties: 'array[int]') -> None:
         self._load_driver()
-        if self._driver and profile_data:
+        if self._driver and duties:
             try:
-                if len(profile_data) == 1:
-                    self._driver.set_fixed_speed(channel_value, profile_data[0][1])
+                if len(duties) == 1:
+                    self._driver.set_fixed_speed(channel_value, duties[0])
                 else:
-                    self._driver.set_speed_profile(channel_value, profile_data)
+                    self._driver.set_speed_profile(channel_value, list(zip(temperatures, duties)))
             # pylint: disable=bare-except
             except:
                 _LOG.exception("Error getting the status")
@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with gkraken.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, TYPE_CHECKING
 
 from gi.repository import GLib, Gtk, Gdk
 from matplotlib.axes import Axes
@@ -23,7 +23,12 @@ from matplotlib.backends.backend_gtk3agg import FigureCanvasGTK3Agg as FigureCan
 from matplotlib.figure import Figure
 
 from gkraken.conf import MIN_TEMP, MAX_TEMP, MAX_DUTY
-from gkraken.model import SpeedProfile
+
+if TYPE_CHECKING:
+    # the models import this module to invalidate the speed profile data cache
+    from gkraken.model import SpeedProfile
+
+_SPEED_PROFILE_DATA_CACHE: Dict[int, Dict[int, int]] = {}
 
 
 def build_glib_option(long_name: str,
@@ -69,16 +74,23 @@ def init_plot_chart(scrolled_window: Gtk.ScrolledWindow,
     return lines
 
 
-def get_speed_profile_data(profile: SpeedProfile) -> Dict[int, int]:
-    data = {p.temperature: p.duty for p in profile.steps}
-    if data:
-        if profile.single_step:
-            data.update({MAX_TEMP: profile.steps[0].duty})
-        else:
-            if MIN_TEMP not in data:
-                data[MIN_TEMP] = data[min(data.keys())]
-            data.update({MAX_TEMP: MAX_DUTY})
-    return data
+def invalidate_speed_profile_data(profile_id: int) -> None:
+    _SPEED_PROFILE_DATA_CACHE.pop(profile_id, None)
+
+
+def get_speed_profile_data(profile: 'SpeedProfile') -> Dict[int, int]:
+    data = _SPEED_PROFILE_DATA_CACHE.get(profile.id)
+    if data is None:
+        data = {p.temperature: p.duty for p in profile.steps}
+        if data:
+            if profile.single_step:
+                data.update({MAX_TEMP: profile.steps[0].duty})
+            else:
+                if MIN_TEMP not in data:
+                    data[MIN_TEMP] = data[min(data.keys())]
+                data.update({MAX_TEMP: MAX_DUTY})
+        _SPEED_PROFILE_DATA_CACHE[profile.id] = data
+    return dict(data)
 
 
 def get_default_application() -> Gtk.Application:
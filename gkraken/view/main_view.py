@@ -17,7 +17,7 @@
 
 import logging
 from collections import OrderedDict
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterable, Tuple
 
 from gkraken.di import MainBuilder
 from gkraken.interactor.settings_interactor import SettingsInteractor
@@ -212,7 +212,7 @@ class MainView(MainViewInterface):
         else:
             self._plot_chart(profile.channel, get_speed_profile_data(profile))
 
-    def refresh_profile_combobox(self, channel: ChannelType, data: List[Tuple[int, str]],
+    def refresh_profile_combobox(self, channel: ChannelType, data: Iterable[Tuple[int, str]],
                                  active: Optional[int]) -> None:
         if channel is ChannelType.FAN:
             self._cooling_fan_liststore.clear()
@@ -45,6 +45,7 @@ class PreferencesView(PreferencesViewInterface):
     def _init_widgets(self) -> None:
         self._dialog: Gtk.Dialog = self._builder.get_object('dialog')
         self._dialog.connect("delete-event", hide_on_delete)
+        self._dialog.connect("hide", self._presenter.on_dialog_hide)
         if is_flatpak():
             self._builder.get_object('settings_launch_on_login_grid').set_sensitive(False)
             self._builder.get_object('settings_launch_on_login_description_label') \